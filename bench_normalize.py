@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import timeit
+
+from swco_accessions.normalize import clean_zip_code, parse_city_state_zip, proper_case
+
+# Micro-benchmarks for the per-record normalization functions. These call the functions
+# directly, not through the NormalizationCache, so they measure the logic itself.
+
+ADDRESSES = [
+    "Lubbock, Texas 79409",
+    "Lubbock, TX 79409-1234",
+    "Lubbock Texas 79409",
+    "Lubbock,Texas 79409 - 1234",
+    "Lubbock Tx 7940l",
+    "Lubbock, Tx I9409",
+    "Lubbock, Texas 794l0-l234",
+    "Santa Fe, New Mexico 87501",
+    "Santa Fe New Mexico 87501",
+    "Pleasant Hill, West Virginia 25123",
+    "Tulsa, OK 74101",
+    "Austin  texas 78701 Apt 4",
+    "Denver CO",
+    "Oklahoma City, Oklahoma",
+    "Box 41041, Lubbock, Texas 79409",
+    "Clovis NM 88101",
+    "New York, NY 10001",
+    "Slaton",
+    # Unicode case variants that IGNORECASE matches against state names
+    "Ames ıa 50010",
+    "Ames İA 50010",
+    "Columbia ſC 29201",
+    "Dodge City Kanſas 67801",
+]
+
+NAMES = [
+    "john smith",
+    "MARY O'BRIEN",
+    "the estate of w. t. jones",
+    "Lubbock county historical society",
+    "dr. ana garcia",
+    "first baptist church of post",
+    "r. l. and betty williams",
+    "SOUTHWEST COLLECTION / SPECIAL COLLECTIONS LIBRARY",
+    "123 main st",
+    "P.O. Box 4090",
+]
+
+ZIPS = ["79409", "79409-1234", "79409 - 1234", "7940l", "I9409", "794l0l234", "79409 1234", "7940", ""]
+
+BENCHMARKS = {
+    'parse_city_state_zip': (parse_city_state_zip, ADDRESSES),
+    'clean_zip_code': (clean_zip_code, ZIPS),
+    'proper_case': (proper_case, NAMES),
+}
+
+def measure(func, corpus, number, repeat):
+    # Best of `repeat` runs, reported per call
+    def run():
+        for value in corpus:
+            func(value)
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return best / (number * len(corpus)) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark the address and name normalization functions")
+    parser.add_argument('-n', '--number', type=int, default=2000, help="passes over the corpus per repeat")
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default='bench_normalize_baseline.json',
+                        help="baseline timings to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="record this run as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="report a regression when a function is this much slower than baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results = {}
+    regressions = []
+    print(f"{'function':<22} {'ns/call':>10} {'calls/sec':>12} {'baseline':>10} {'change':>8}")
+    for name, (func, corpus) in BENCHMARKS.items():
+        ns = measure(func, corpus, args.number, args.repeat)
+        results[name] = ns
+        line = f"{name:<22} {ns:>10,.0f} {1e9 / ns:>12,.0f}"
+        if name in baseline:
+            change = ns / baseline[name] - 1
+            line += f" {baseline[name]:>10,.0f} {change:>+8.1%}"
+            if change > args.tolerance:
+                regressions.append(name)
+        print(line)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    if regressions:
+        print(f"Slower than baseline by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
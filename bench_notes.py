@@ -0,0 +1,48 @@
+import argparse
+import time
+
+from swco_accessions.docx_stream import TextDocument
+from swco_accessions.log import setup_logging
+from swco_accessions.records import iter_records
+
+# Parses one record whose Scope and Content Note runs on for N continuation paragraphs.
+# Continuation lines are joined once per record, so time per line should stay flat as N grows;
+# a cost that rises with N means the accumulation has gone quadratic again.
+
+LINE = "Correspondence, ledgers and photographs documenting ranching operations in the South Plains."
+
+def note_record(lines):
+    texts = ["Number 84-001-A", "Donor john smith", "Scope and Content Note " + LINE]
+    texts.extend([LINE] * lines)
+    texts.append("Permanent Location A-1")
+    return texts
+
+def measure(lines, repeat):
+    doc = TextDocument(note_record(lines))
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in iter_records(doc):
+            pass
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Show how parse time scales with note length")
+    parser.add_argument('-n', '--lines', type=int, nargs='+', default=[100, 1000, 10000, 100000],
+                        help="continuation paragraphs in the note")
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_logging(None, console=False)
+    print(f"{'lines':>8} {'total':>10} {'us/line':>9} {'vs first':>9}")
+    first = None
+    for lines in args.lines:
+        elapsed = measure(lines, args.repeat)
+        per_line = elapsed / lines * 1e6
+        first = first or per_line
+        print(f"{lines:>8} {elapsed * 1000:>8.2f}ms {per_line:>9.3f} {per_line / first:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+import resource
+import tempfile
+import time
+
+from make_synthetic_ledger import write_ledger
+from swco_accessions import records
+from swco_accessions.convert import convert_document
+from swco_accessions.docx_stream import TextDocument, iter_paragraph_text
+from swco_accessions.log import setup_logging
+from swco_accessions.sinks import CsvSink
+
+def timed(func, totals):
+    def wrapper(*args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            totals[0] += time.perf_counter() - start
+    return wrapper
+
+def clear_caches():
+    for cache in records.NORMALIZATION_CACHES:
+        cache.clear()
+
+def bench_ledger(path, output_dir):
+    result = {'path': path}
+
+    # End to end first, while nothing else is held in memory, so peak RSS reflects streaming
+    clear_caches()
+    sink = CsvSink(os.path.join(output_dir, 'bench_e2e.csv'))
+    start = time.perf_counter()
+    result['records'] = convert_document(path, sink)
+    sink.close()
+    result['total'] = time.perf_counter() - start
+    result['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    # Then stage by stage
+    start = time.perf_counter()
+    texts = list(iter_paragraph_text(path))
+    result['load'] = time.perf_counter() - start
+
+    # Normalization runs inside iter_records, so the cached entry points are swapped for
+    # timing wrappers and that time is taken back out of the parse figure
+    clear_caches()
+    normalize_time = [0.0]
+    originals = records.cached_parse_city_state_zip, records.cached_proper_case
+    records.cached_parse_city_state_zip = timed(originals[0], normalize_time)
+    records.cached_proper_case = timed(originals[1], normalize_time)
+    try:
+        start = time.perf_counter()
+        parsed = list(records.iter_records(TextDocument(texts)))
+        parse_and_normalize = time.perf_counter() - start
+    finally:
+        records.cached_parse_city_state_zip, records.cached_proper_case = originals
+    result['normalize'] = normalize_time[0]
+    result['parse'] = parse_and_normalize - normalize_time[0]
+
+    sink = CsvSink(os.path.join(output_dir, 'bench_staged.csv'))
+    start = time.perf_counter()
+    for record in parsed:
+        sink.write(record)
+    sink.close()
+    result['write'] = time.perf_counter() - start
+    return result
+
+def bench_size(size, output_dir, seed):
+    path = os.path.join(output_dir, f'synthetic_{size}.docx')
+    start = time.perf_counter()
+    write_ledger(path, size, seed)
+    generate = time.perf_counter() - start
+    result = bench_ledger(path, output_dir)
+    result['generate'] = generate
+    return result
+
+def print_report(results):
+    print(f"{'records':>9} {'rec/s':>9} {'total':>8} {'load':>8} {'parse':>8} {'normalize':>9} {'write':>8} {'peak RSS':>9}")
+    for r in results:
+        rate = r['records'] / r['total'] if r['total'] else 0
+        print(f"{r['records']:>9} {rate:>9,.0f} {r['total']:>7.2f}s {r['load']:>7.2f}s {r['parse']:>7.2f}s "
+              f"{r['normalize']:>8.2f}s {r['write']:>7.2f}s {r['peak_rss_mb']:>6.0f} MB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the converter on synthetic accession ledgers")
+    parser.add_argument('-n', '--records', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="ledger sizes to generate and convert (up to 1000000)")
+    parser.add_argument('--ledger', nargs='+', help="benchmark existing .docx files instead of generating")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep', metavar='DIR', help="write generated ledgers and outputs here and keep them")
+    args = parser.parse_args()
+
+    setup_logging(None, console=False)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_dir = args.keep or tmp_dir
+        os.makedirs(output_dir, exist_ok=True)
+        results = []
+        # Each run gets a fresh process so peak RSS is measured per ledger
+        jobs = [(bench_ledger, (path, output_dir)) for path in args.ledger] if args.ledger else \
+            [(bench_size, (size, output_dir, args.seed)) for size in args.records]
+        for func, func_args in jobs:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                results.append(executor.submit(func, *func_args).result())
+        print_report(results)
+
+if __name__ == "__main__":
+    main()
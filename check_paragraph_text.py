@@ -0,0 +1,90 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+from make_synthetic_ledger import CONTENT_TYPES, DOCUMENT_END, DOCUMENT_START, PACKAGE_RELS, write_ledger
+from swco_accessions.docx_stream import iter_paragraph_text
+
+# Differential check of the streaming extractor against python-docx's Paragraph.text, which the
+# converter used to read. With no arguments it runs on a document of awkward paragraphs plus a
+# synthetic ledger; pass .docx paths to check real ledgers as well.
+
+EDGE_CASE_PARAGRAPHS = [
+    '<w:p/>',
+    '<w:p><w:r><w:t>plain</w:t></w:r></w:p>',
+    '<w:p><w:r><w:t xml:space="preserve">  padded  </w:t></w:r><w:r><w:t/></w:r></w:p>',
+    # Tab stops in the paragraph properties are not text
+    '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+    '<w:r><w:t>Processing Completed?</w:t></w:r><w:r><w:tab/><w:t>yes</w:t></w:r></w:p>',
+    '<w:p><w:r><w:t>line</w:t><w:br/><w:t>wrap</w:t><w:br w:type="textWrapping" w:clear="all"/></w:r></w:p>',
+    '<w:p><w:r><w:t>page</w:t><w:br w:type="page"/><w:t>column</w:t><w:br w:type="column"/></w:r></w:p>',
+    '<w:p><w:r><w:t>soft</w:t><w:cr/><w:t>return</w:t></w:r></w:p>',
+    '<w:p><w:r><w:t>84</w:t><w:noBreakHyphen/><w:t>94</w:t><w:softHyphen/><w:ptab w:relativeTo="margin" '
+    'w:alignment="right" w:leader="none"/><w:t>A</w:t></w:r></w:p>',
+    '<w:p><w:r><w:t>see </w:t></w:r><w:hyperlink w:anchor="x"><w:r><w:t>link</w:t></w:r>'
+    '<w:r><w:tab/><w:t>text</w:t></w:r></w:hyperlink></w:p>',
+    # Tracked changes, fields, smart tags and content controls are not direct runs
+    '<w:p><w:r><w:t>kept</w:t></w:r><w:ins w:id="1" w:author="a"><w:r><w:t>inserted</w:t></w:r></w:ins>'
+    '<w:del w:id="2" w:author="a"><w:r><w:delText>deleted</w:delText></w:r></w:del></w:p>',
+    '<w:p><w:r><w:fldChar w:fldCharType="begin"/></w:r><w:r><w:instrText> PAGE </w:instrText></w:r>'
+    '<w:r><w:fldChar w:fldCharType="separate"/></w:r><w:r><w:t>3</w:t></w:r>'
+    '<w:r><w:fldChar w:fldCharType="end"/></w:r><w:fldSimple w:instr="DATE"><w:r><w:t>1994</w:t></w:r></w:fldSimple></w:p>',
+    '<w:p><w:smartTag w:uri="u" w:element="City"><w:r><w:t>Lubbock</w:t></w:r></w:smartTag>'
+    '<w:sdt><w:sdtContent><w:r><w:t>control</w:t></w:r></w:sdtContent></w:sdt><w:r><w:t>, Texas</w:t></w:r></w:p>',
+    '<w:p><w:r><w:lastRenderedPageBreak/><w:t>after break</w:t><w:sym w:font="Symbol" w:char="F0B7"/></w:r></w:p>',
+    # A text box inside a run: its paragraphs belong to the box, not to this paragraph
+    '<w:p><w:r><w:t>outer</w:t><w:pict><w:txbxContent><w:p><w:r><w:t>boxed</w:t></w:r></w:p>'
+    '</w:txbxContent></w:pict></w:r></w:p>',
+    '<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>café “quoted”</w:t></w:r></w:p>',
+]
+
+def write_edge_cases(path):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', PACKAGE_RELS)
+        archive.writestr('word/document.xml', DOCUMENT_START + ''.join(EDGE_CASE_PARAGRAPHS) + DOCUMENT_END)
+
+def compare(path, Document):
+    start = time.perf_counter()
+    expected = [paragraph.text for paragraph in Document(path).paragraphs]
+    docx_time = time.perf_counter() - start
+    start = time.perf_counter()
+    # python-docx's doc.paragraphs skips tables, so they are left out here too
+    actual = list(iter_paragraph_text(path, tables=False))
+    stream_time = time.perf_counter() - start
+
+    mismatches = [(i, want, got) for i, (want, got) in enumerate(zip(expected, actual)) if want != got]
+    print(f"{path}: {len(expected)} paragraphs, python-docx {docx_time:.2f}s, "
+          f"streaming {stream_time:.2f}s ({docx_time / stream_time if stream_time else 0:.1f}x)")
+    if len(expected) != len(actual):
+        print(f"  paragraph count differs: python-docx {len(expected)}, streaming {len(actual)}")
+    for i, want, got in mismatches[:10]:
+        print(f"  paragraph {i+1}: python-docx {want!r}, streaming {got!r}")
+    return not mismatches and len(expected) == len(actual)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check streamed paragraph text against python-docx")
+    parser.add_argument('inputs', nargs='*', help=".docx files to check in addition to the built-in cases")
+    parser.add_argument('-n', '--records', type=int, default=2000, help="size of the synthetic ledger")
+    args = parser.parse_args()
+
+    try:
+        from docx import Document
+    except ImportError:
+        raise RuntimeError("The differential check needs python-docx (pip install python-docx)")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        edge_cases = os.path.join(tmp_dir, 'edge_cases.docx')
+        write_edge_cases(edge_cases)
+        ledger = os.path.join(tmp_dir, 'synthetic.docx')
+        write_ledger(ledger, args.records)
+        results = [compare(path, Document) for path in [edge_cases, ledger] + args.inputs]
+    if not all(results):
+        sys.exit(1)
+    print("All paragraphs match")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import random
+import zipfile
+from xml.sax.saxutils import escape
+
+# Writes .docx ledgers in the layout parse_records expects, without python-docx, so that
+# million-record files can be produced quickly. The XML is streamed into the zip.
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+DOCUMENT_END = '<w:sectPr/></w:body></w:document>'
+
+DONORS = [
+    "john smith", "MARY O'BRIEN", "the estate of w. t. jones", "Lubbock county historical society",
+    "dr. ana garcia", "first baptist church of post", "r. l. and betty williams",
+]
+STREETS = ["123 main st", "P.O. Box 4090", "2601 19th street", "Rt. 2, box 17", "1500 avenue q apt 3"]
+CITY_STATE_ZIPS = [
+    "Lubbock, Texas 79409",
+    "Lubbock, TX 79409-1234",
+    "Lubbock Texas 79409",
+    "Lubbock,Texas 79409 - 1234",
+    "Lubbock Tx 7940l",
+    "Lubbock, Tx I9409",
+    "Santa Fe, New Mexico 87501",
+    "Pleasant Hill, West Virginia 25123",
+    "Tulsa, OK 74101",
+    "Austin  texas 78701 Apt 4",
+    "Denver CO",
+    "Oklahoma City, Oklahoma",
+    "Box 41041, Lubbock, Texas 79409",
+    "Clovis NM 88101",
+]
+NOTE_SENTENCES = [
+    "Correspondence, ledgers and photographs documenting ranching operations in the South Plains.",
+    "Includes minutes of meetings, membership rolls and newspaper clippings.",
+    "Materials relate to cotton farming, irrigation and the Dust Bowl years.",
+    "Family papers, 1889-1972, with some oversize maps and plats.",
+    "Oral history transcripts and audio cassettes.",
+]
+
+def paragraph(text):
+    runs = []
+    for i, chunk in enumerate(text.split('\t')):
+        if i:
+            runs.append('<w:r><w:tab/></w:r>')
+        if chunk:
+            runs.append(f'<w:r><w:t xml:space="preserve">{escape(chunk)}</w:t></w:r>')
+    return f"<w:p>{''.join(runs)}</w:p>"
+
+def iter_record_paragraphs(records, seed=0, note_lines=(0, 4)):
+    rng = random.Random(seed)
+    yield "Accession Records"
+    yield ""
+    for i in range(records):
+        yield f"Number {84 + i % 16:02d}-{i:03d}-{rng.choice('AABBCX')}"
+        yield f"Donor {rng.choice(DONORS)}"
+        if rng.random() < 0.2:
+            yield f"Courtesy of {rng.choice(DONORS)}"
+        yield f"Street {rng.choice(STREETS)}"
+        yield f"City, State, Zip {rng.choice(CITY_STATE_ZIPS)}"
+        yield f"Donation/Lending Date {rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1984, 1999)}"
+        yield f"Main Entry {rng.choice(DONORS)} papers"
+        yield f"Quantity {rng.randint(1, 40)} linear feet"
+        yield "Restrictions none"
+        yield f"Assigned to Record Group {rng.randint(1, 30)}"
+        yield "Processing Completed?\tyes"
+        yield f"Processor {rng.choice(DONORS)}"
+        if rng.random() < 0.1:
+            yield f"Returned by {rng.choice(DONORS)}"
+            yield "Returned yes"
+            yield f"Date returned {rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1990, 2005)}"
+        yield f"Scope and Content Note {rng.choice(NOTE_SENTENCES)}"
+        # Continuation paragraphs with no label get appended to the Scope and Content Note
+        for _ in range(rng.randint(*note_lines)):
+            yield rng.choice(NOTE_SENTENCES)
+        yield f"Permanent Location {rng.choice('ABCDEFG')}-{rng.randint(1, 400)}"
+        if rng.random() < 0.05:
+            yield f"[[{i // 20 + 1}]]"
+
+def write_ledger(path, records, seed=0, note_lines=(0, 4)):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', PACKAGE_RELS)
+        with archive.open('word/document.xml', 'w', force_zip64=True) as document:
+            document.write(DOCUMENT_START.encode('utf-8'))
+            buffer = []
+            for text in iter_record_paragraphs(records, seed, note_lines):
+                buffer.append(paragraph(text))
+                if len(buffer) >= 1000:
+                    document.write(''.join(buffer).encode('utf-8'))
+                    buffer = []
+            buffer.append(DOCUMENT_END)
+            document.write(''.join(buffer).encode('utf-8'))
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic accession ledger .docx")
+    parser.add_argument('output', help="path of the .docx to write")
+    parser.add_argument('-n', '--records', type=int, default=1000, help="number of accession records")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-note-lines', type=int, default=4,
+                        help="most continuation paragraphs per Scope and Content Note")
+    args = parser.parse_args()
+    write_ledger(args.output, args.records, args.seed, (0, args.max_note_lines))
+
+if __name__ == "__main__":
+    main()
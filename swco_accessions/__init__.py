@@ -0,0 +1,39 @@
+import importlib
+
+# Public names resolve to their submodules on first use, so `python -m swco_accessions --help`
+# and other light entry points don't pay for the regex tables and writers up front
+_EXPORTS = {
+    'run': 'convert',
+    'convert_document': 'convert',
+    'resolve_inputs': 'convert',
+    'StreamingDocument': 'docx_stream',
+    'TextDocument': 'docx_stream',
+    'FIELD_NAMES': 'fields',
+    'OUTPUT_FIELDS': 'fields',
+    'STATE_MAP': 'normalize',
+    'clean_zip_code': 'normalize',
+    'parse_city_state_zip': 'normalize',
+    'proper_case': 'normalize',
+    'Pipeline': 'pipeline',
+    'ParseOptions': 'records',
+    'iter_records': 'records',
+    'parse_records': 'records',
+    'SINKS': 'sinks',
+    'CsvSink': 'sinks',
+    'JsonlSink': 'sinks',
+    'ParquetSink': 'sinks',
+    'SqliteSink': 'sinks',
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+import json
+import os
+
+# Bump when parse_city_state_zip or proper_case change output, so stale cache files are ignored
+CACHE_VERSION = 1
+
+class NormalizationCache:
+    # Bounded LRU in front of a pure one-argument function, with hit/miss counters
+    def __init__(self, func, maxsize=8192):
+        self.func = func
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.new_entries = None
+
+    def __call__(self, key):
+        entries = self.entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self.func(key)
+            entries[key] = value
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+            if self.new_entries is not None:
+                self.new_entries[key] = value
+            return value
+        self.hits += 1
+        entries.move_to_end(key)
+        return value
+
+    def track_new(self):
+        # Remembers the entries computed from now on, so a worker process can hand them back
+        self.new_entries = {}
+
+    def take_new(self):
+        if not self.new_entries:
+            return []
+        taken = list(self.new_entries.items())
+        self.new_entries.clear()
+        return taken
+
+    def merge(self, items):
+        entries = self.entries
+        for key, value in items:
+            if key not in entries:
+                entries[key] = value
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self):
+        return f"{self.func.__name__}: {self.hits} hits, {self.misses} misses, {len(self.entries)} cached"
+
+def load_caches(path, caches):
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return
+    if data.get('version') != CACHE_VERSION:
+        return
+    for cache in caches:
+        for key, value in data.get(cache.func.__name__, [])[-cache.maxsize:]:
+            cache.entries[key] = tuple(value) if isinstance(value, list) else value
+
+def take_new_entries(caches):
+    return [cache.take_new() for cache in caches]
+
+def merge_new_entries(caches, learned):
+    for cache, items in zip(caches, learned):
+        cache.merge(items)
+
+def save_caches(path, caches):
+    data = {'version': CACHE_VERSION}
+    for cache in caches:
+        data[cache.func.__name__] = list(cache.entries.items())
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+        json.dump(data, cache_file)
+    os.replace(tmp_path, path)
@@ -0,0 +1,79 @@
+import time
+
+CLI_IMPORTED = time.perf_counter()
+
+from .sinks import COMPRESSION_SUFFIXES, SINKS
+import argparse
+import sys
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m swco_accessions',
+                                     description="Convert accession ledger .docx files into structured records")
+    parser.add_argument('inputs', nargs='*', help=".docx files, directories of them, or glob patterns (default: ./ignore/84-94A-copy.docx)")
+    parser.add_argument('-o', '--output', help="merged output file, default output.<format> (ignored with --per-file)")
+    parser.add_argument('-f', '--format', choices=sorted(SINKS), default='csv', help="output format")
+    parser.add_argument('--compress', choices=sorted(COMPRESSION_SUFFIXES),
+                        help="compress jsonl output as it is written, whatever the -o name "
+                             "(without it, a .gz/.zst -o name picks the compression)")
+    parser.add_argument('--per-file', action='store_true', help="write one output file per input document instead of a merged one")
+    parser.add_argument('--output-dir', default='.', help="directory for --per-file outputs")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="convert documents in this many processes")
+    parser.add_argument('--chunk-records', type=int, default=500,
+                        help="records per shard when a single document is split across --workers")
+    parser.add_argument('--incremental', action='store_true',
+                        help="re-parse only documents and record blocks that changed since the last --incremental run")
+    parser.add_argument('--manifest', help="content-hash manifest for --incremental (default: next to the output)")
+    parser.add_argument('--no-split-address', dest='split_address', action='store_false',
+                        help="keep City, State, Zip as one field instead of splitting it into columns")
+    parser.add_argument('--no-proper-case', dest='proper_case', action='store_false',
+                        help="leave names and streets in their original case")
+    parser.add_argument('--no-clean-zips', dest='clean_zips', action='store_false',
+                        help="split addresses as convert_accession_document10/11 did: zip codes as written, "
+                             "without l/I typo fixes or ZIP+4 normalisation")
+    parser.add_argument('--no-tables', dest='tables', action='store_false',
+                        help="read body paragraphs only and skip label/value rows in Word tables")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="overlap reading, parsing and writing in threads joined by bounded queues, "
+                             "e.g. for batches on network shares")
+    parser.add_argument('--debug', action='store_true', help="trace every paragraph and field to debug_output.txt")
+    parser.add_argument('--cache-file', help="persist the address/proper-case cache here between runs")
+    parser.add_argument('--profile', action='store_true', help="print wall time and call counts per pipeline stage")
+    parser.add_argument('--profile-json', metavar='PATH', help="write the per-stage timings to PATH as JSON")
+    parser.add_argument('--cprofile', metavar='PATH', help="run under cProfile and dump the stats to PATH")
+    parser.add_argument('--startup-time', action='store_true',
+                        help="report how long argument parsing and the converter imports took "
+                             "(use python -X importtime for a per-module breakdown)")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.incremental and args.format != 'csv':
+        parser.error("--incremental reuses rows from a previous CSV output and needs --format csv")
+    if args.compress and args.format != 'jsonl':
+        parser.error("--compress is only supported with --format jsonl")
+    if args.incremental and args.workers > 1:
+        parser.error("--incremental re-parses changed blocks in one process and cannot be combined with --workers")
+    if args.pipeline and (args.incremental or args.workers > 1):
+        parser.error("--pipeline runs in one process and cannot be combined with --incremental or --workers")
+    parsed = time.perf_counter()
+    
+    # The parser, regex tables and XML reader are only imported once there is work to do
+    from .convert import run
+    from .records import ParseOptions
+    if args.startup_time:
+        imported = time.perf_counter()
+        print(f"Startup: {(parsed - CLI_IMPORTED) * 1000:.1f} ms argument parsing, "
+              f"{(imported - parsed) * 1000:.1f} ms converter imports", file=sys.stderr)
+    
+    options = ParseOptions(split_address=args.split_address, proper_case=args.proper_case, clean_zips=args.clean_zips,
+                           tables=args.tables)
+    failures = run(args.inputs or None, output=args.output, output_format=args.format, compress=args.compress,
+                   per_file=args.per_file, output_dir=args.output_dir, workers=args.workers,
+                   chunk_records=args.chunk_records, incremental=args.incremental, manifest_path=args.manifest,
+                   debug=args.debug, cache_file=args.cache_file, profile=args.profile,
+                   profile_json=args.profile_json, cprofile=args.cprofile, options=options,
+                   pipeline=args.pipeline)
+    # Scheduled runs need a non-zero status when any document could not be converted
+    if failures:
+        sys.exit(1)
@@ -0,0 +1,425 @@
+from . import records
+from .cache import CACHE_VERSION, load_caches, merge_new_entries, save_caches, take_new_entries
+from .docx_stream import StreamingDocument, iter_paragraph_text
+from .log import logger, setup_logging
+from .records import DEFAULT_OPTIONS, NORMALIZATION_CACHES, NUMBER, STAGES, iter_record_chunks, iter_records, parse_chunk
+from .sinks import COMPRESSION_SUFFIXES, SINKS, record_row
+from collections import deque
+import csv
+import functools
+import glob
+import json
+import logging
+import os
+import re
+import time
+
+DEFAULT_INPUT = './ignore/84-94A-copy.docx'
+
+NUMBER_KEY_RE = re.compile(r'(\d+)-(\d+)')
+
+MANIFEST_VERSION = 1
+
+def resolve_inputs(inputs):
+    # Each input may be a .docx file, a directory of them, or a glob pattern
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(glob.glob(os.path.join(item, '*.docx')))
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item))
+        else:
+            matches = [item]
+        # Skip the ~$ lock files Word leaves next to open documents
+        paths.extend(path for path in matches if not os.path.basename(path).startswith('~$'))
+    return paths
+
+def iter_document_records(path, options=DEFAULT_OPTIONS):
+    doc = StreamingDocument(path, options.tables)
+    if STAGES.enabled:
+        doc = STAGES.document(doc, 'load')
+    return iter_records(doc, options)
+
+def write_records(sink, records):
+    write = sink.write
+    if STAGES.enabled:
+        write = STAGES.wrap('write', write)
+    count = 0
+    for record in records:
+        write(record)
+        count += 1
+    return count
+
+def convert_document(path, sink, options=DEFAULT_OPTIONS):
+    return write_records(sink, iter_document_records(path, options))
+
+def parse_document(path, options=DEFAULT_OPTIONS):
+    # Runs in a worker; also returns the normalization results it computed, for the parent's caches
+    start = time.perf_counter()
+    parsed = list(iter_records(StreamingDocument(path, options.tables), options))
+    return parsed, time.perf_counter() - start, take_new_entries(NORMALIZATION_CACHES)
+
+def parse_chunk_in_worker(chunk, options=DEFAULT_OPTIONS):
+    return parse_chunk(chunk, options), take_new_entries(NORMALIZATION_CACHES)
+
+def parse_document_sharded(path, workers, chunk_records, level, cache_file, options=DEFAULT_OPTIONS):
+    # Chunks are parsed in parallel and collected in document order. Only a bounded
+    # window of chunks is in flight, so the document is still read incrementally
+    from concurrent.futures import ProcessPoolExecutor
+    parsed = []
+    
+    def collect(future):
+        block, learned = future.result()
+        merge_new_entries(NORMALIZATION_CACHES, learned)
+        parsed.extend(block)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(level, cache_file)) as executor:
+        pending = deque()
+        for chunk in iter_record_chunks(iter_paragraph_text(path, options.tables), chunk_records):
+            pending.append(executor.submit(parse_chunk_in_worker, chunk, options))
+            if len(pending) >= workers * 2:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+    return parsed
+
+def file_sha256(path):
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def block_key(texts):
+    # A record block is identified by its Number line plus a hash of all of its paragraphs
+    import hashlib
+    digest = hashlib.sha1('\n'.join(texts).encode('utf-8')).hexdigest()
+    return f"{texts[0].strip()}|{digest}"
+
+def load_manifest(path, options=DEFAULT_OPTIONS):
+    try:
+        with open(path, encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    # Rows converted by older normalization code or with other parse options can't be reused
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('normalize_version') != CACHE_VERSION:
+        return None
+    if manifest.get('options') != options.as_dict():
+        return None
+    return manifest
+
+def save_manifest(path, outputs, documents, options=DEFAULT_OPTIONS):
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'normalize_version': CACHE_VERSION,
+        'options': options.as_dict(),
+        'outputs': {output: file_sha256(output) for output in outputs if os.path.exists(output)},
+        'documents': documents,
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(tmp_path, path)
+
+def load_previous_rows(manifest):
+    # Maps each source path to (manifest entry, its rows in the previous output). Outputs that
+    # were edited or regenerated since the manifest was written are not trusted
+    rows_by_output = {}
+    for output, digest in manifest['outputs'].items():
+        if os.path.exists(output) and file_sha256(output) == digest:
+            with open(output, newline='', encoding='utf-8') as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader, None)
+                rows_by_output[output] = list(reader)
+    previous = {}
+    offsets = {}
+    for entry in manifest['documents']:
+        rows = rows_by_output.get(entry['output'])
+        if rows is None:
+            continue
+        start = offsets.get(entry['output'], 0)
+        previous[entry['path']] = (entry, rows[start:start + entry['rows']])
+        offsets[entry['output']] = start + entry['rows']
+    return previous
+
+def convert_document_incremental(path, output, previous, options=DEFAULT_OPTIONS):
+    # Returns (manifest entry, rows, blocks re-parsed). Unchanged documents are copied from the
+    # previous output without being opened; otherwise only blocks whose key is new get parsed
+    sha256 = file_sha256(path)
+    if previous:
+        entry, previous_rows = previous
+        if entry['sha256'] == sha256 and entry['output'] == output:
+            return entry, previous_rows, 0
+    
+    reusable = {}
+    if previous:
+        offset = 0
+        for key, count in entry['blocks']:
+            reusable.setdefault(key, deque()).append(previous_rows[offset:offset + count])
+            offset += count
+    
+    rows = []
+    blocks = []
+    reparsed = 0
+    for texts in iter_record_chunks(iter_paragraph_text(path, options.tables), 1):
+        key = block_key(texts)
+        if reusable.get(key):
+            block_rows = reusable[key].popleft()
+        else:
+            block_rows = [record_row(record) for record in parse_chunk(texts, options)]
+            reparsed += 1
+        rows.extend(block_rows)
+        blocks.append([key, len(block_rows)])
+    entry = {'path': path, 'sha256': sha256, 'output': output, 'rows': len(rows), 'blocks': blocks}
+    return entry, rows, reparsed
+
+def number_sort_key(record):
+    # "1984-12" sorts by year, then by sequence number as an integer
+    number = record[NUMBER] or ""
+    number_match = NUMBER_KEY_RE.match(number)
+    if number_match:
+        return (0, int(number_match.group(1)), int(number_match.group(2)), number)
+    return (1, 0, 0, number)
+
+def init_worker(level, cache_file):
+    # Workers only log to the console; interleaving their traces in one debug file is not useful
+    setup_logging(None, level=level)
+    load_caches(cache_file, NORMALIZATION_CACHES)
+    if cache_file:
+        # Each task hands back what it computed, so the parent can save it to --cache-file
+        for cache in NORMALIZATION_CACHES:
+            cache.track_new()
+
+def parse_documents_parallel(paths, workers, level, cache_file, options=DEFAULT_OPTIONS):
+    # Yields (path, parsed, elapsed, error) in input order; a failing document
+    # is reported without cancelling the others
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(level, cache_file)) as executor:
+        futures = [executor.submit(parse_document, path, options) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                parsed, elapsed, learned = future.result()
+            except Exception as e:
+                yield path, None, 0.0, e
+            else:
+                merge_new_entries(NORMALIZATION_CACHES, learned)
+                yield path, parsed, elapsed, None
+
+def per_file_output(path, output_dir, extension='csv'):
+    return os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + '.' + extension)
+
+def run(inputs=None, output=None, output_format='csv', compress=None, per_file=False,
+         output_dir='.', workers=1, chunk_records=500, incremental=False, manifest_path=None,
+         debug=False, cache_file=None, profile=False, profile_json=None, cprofile=None,
+         options=DEFAULT_OPTIONS, pipeline=False):
+    level = logging.DEBUG if debug else logging.INFO
+    setup_logging('debug_output.txt', level=level)
+    load_caches(cache_file, NORMALIZATION_CACHES)
+    if profile or profile_json:
+        records.enable_stage_timing()
+        if workers > 1:
+            logger.warning("Stage timings only cover work done in the main process, not in --workers")
+        if pipeline:
+            logger.warning("Stage timings overlap when --pipeline runs the stages in threads")
+    
+    paths = resolve_inputs(inputs or (DEFAULT_INPUT,))
+    if not paths:
+        # Nothing to convert is almost always a mistyped path or pattern, so the run fails
+        logger.error("No input documents found")
+        return 1
+    
+    timings = []
+    failures = []
+    total = 0
+    sink_class = SINKS[output_format]
+    if incremental and output_format != 'csv':
+        # Previous rows are read back from the CSV output
+        raise ValueError("incremental is only supported for csv output")
+    if compress:
+        if output_format != 'jsonl':
+            raise ValueError("compress is only supported for jsonl output")
+        # Applies whatever the output is called, not only to the default .gz/.zst names
+        sink_class = functools.partial(sink_class, compress=compress)
+    extension = output_format + COMPRESSION_SUFFIXES.get(compress, '')
+    if output is None:
+        output = 'output.' + extension
+    if per_file:
+        # Outputs are named after the document's basename, so same-named documents from
+        # different folders would silently overwrite each other's output
+        sources = {}
+        for path in paths:
+            sources.setdefault(os.path.normcase(per_file_output(path, output_dir, extension)), []).append(path)
+        collisions = {target: same for target, same in sources.items() if len(same) > 1}
+        if collisions:
+            for target, same in collisions.items():
+                logger.error(f"--per-file would write {', '.join(same)} to the same output {target}")
+            logger.error("Nothing was converted; rename the documents or convert them in separate runs")
+            return len(paths)
+        os.makedirs(output_dir, exist_ok=True)
+    merged_sink = None if per_file else sink_class(output)
+    if incremental and not manifest_path:
+        manifest_path = os.path.join(output_dir, 'manifest.json') if per_file else output + '.manifest.json'
+    profiler = None
+    if cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    STAGES.reset()
+    STAGES.start()
+    try:
+        if incremental:
+            # Previous rows have to be read before any output file is reopened for writing
+            manifest = load_manifest(manifest_path, options)
+            previous = load_previous_rows(manifest) if manifest else {}
+            entries = []
+            for path in paths:
+                target = per_file_output(path, output_dir, extension) if per_file else output
+                start = time.perf_counter()
+                try:
+                    entry, rows, reparsed = convert_document_incremental(path, target, previous.get(path), options)
+                    # Rows only go out once the whole document succeeded, so the manifest's row
+                    # counts always line up with the output
+                    if per_file:
+                        # A sink that can't be opened fails this document, not the whole run
+                        sink = sink_class(target)
+                        try:
+                            for row in rows:
+                                sink.write_row(row)
+                        finally:
+                            sink.close()
+                except Exception as e:
+                    logger.error(f"{path}: conversion failed: {e}")
+                    failures.append(path)
+                    continue
+                if not per_file:
+                    for row in rows:
+                        merged_sink.write_row(row)
+                entries.append(entry)
+                timings.append((path, len(rows), time.perf_counter() - start))
+                total += len(rows)
+                logger.info(f"{path}: {reparsed} of {len(entry['blocks'])} record blocks re-parsed")
+                if per_file and rows:
+                    logger.info(f"Processed {len(rows)} records and saved to {target}")
+            if merged_sink is not None:
+                merged_sink.close()
+            save_manifest(manifest_path, {entry['output'] for entry in entries}, entries, options)
+        elif workers > 1 and len(paths) > 1:
+            merged = []
+            for path, parsed, elapsed, error in parse_documents_parallel(paths, workers, level, cache_file, options):
+                if error is not None:
+                    logger.error(f"{path}: conversion failed: {error}")
+                    failures.append(path)
+                    continue
+                if per_file:
+                    try:
+                        sink = sink_class(per_file_output(path, output_dir, extension))
+                        try:
+                            for record in parsed:
+                                sink.write(record)
+                        finally:
+                            sink.close()
+                    except Exception as e:
+                        logger.error(f"{path}: conversion failed: {e}")
+                        failures.append(path)
+                        continue
+                    if parsed:
+                        logger.info(f"Processed {len(parsed)} records and saved to {sink.path}")
+                else:
+                    merged.extend(parsed)
+                timings.append((path, len(parsed), elapsed))
+                total += len(parsed)
+            # Documents finish in any order, so the merged output is ordered by accession Number
+            merged.sort(key=number_sort_key)
+            for record in merged:
+                merged_sink.write(record)
+        elif pipeline:
+            from .pipeline import Pipeline
+            with Pipeline(paths, options) as documents:
+                for path, blocks in documents:
+                    sink = merged_sink
+                    start = time.perf_counter()
+                    try:
+                        parsed = []
+                        for block in blocks:
+                            parsed.extend(block)
+                        if per_file:
+                            sink = sink_class(per_file_output(path, output_dir, extension))
+                        count = write_records(sink, parsed)
+                    except Exception as e:
+                        logger.error(f"{path}: conversion failed: {e}")
+                        failures.append(path)
+                        continue
+                    finally:
+                        if sink is not merged_sink:
+                            sink.close()
+                    # Measured from when the writer reached the document, which overlaps the others
+                    timings.append((path, count, time.perf_counter() - start))
+                    total += count
+                    if per_file and count:
+                        logger.info(f"Processed {count} records and saved to {sink.path}")
+        else:
+            for path in paths:
+                sink = merged_sink
+                start = time.perf_counter()
+                try:
+                    # As with --incremental, a document's records are only written once all of
+                    # it has parsed, so one that fails partway leaves no rows in the output
+                    if workers > 1:
+                        parsed = parse_document_sharded(path, workers, chunk_records, level, cache_file, options)
+                    else:
+                        parsed = list(iter_document_records(path, options))
+                    if per_file:
+                        # A sink that can't be opened fails this document, not the whole run
+                        sink = sink_class(per_file_output(path, output_dir, extension))
+                    count = write_records(sink, parsed)
+                except Exception as e:
+                    logger.error(f"{path}: conversion failed: {e}")
+                    failures.append(path)
+                    continue
+                finally:
+                    if sink is not merged_sink:
+                        sink.close()
+                timings.append((path, count, time.perf_counter() - start))
+                total += count
+                if per_file and count:
+                    logger.info(f"Processed {count} records and saved to {sink.path}")
+    finally:
+        if merged_sink is not None:
+            merged_sink.close()
+        STAGES.stop()
+        if profile or profile_json:
+            records.disable_stage_timing()
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(cprofile)
+    
+    logger.info(f"Total records found: {total}")
+    if not total:
+        logger.info("No records found")
+    elif not per_file:
+        logger.info(f"Processed {total} records and saved to {output}")
+    
+    if len(timings) > 1:
+        for path, count, elapsed in timings:
+            logger.info(f"{path}: {count} records in {elapsed:.2f}s")
+    if failures:
+        logger.error(f"{len(failures)} of {len(paths)} documents failed: {', '.join(failures)}")
+    
+    for cache in NORMALIZATION_CACHES:
+        if cache.hits or cache.misses:
+            logger.info(f"Cache {cache.stats()}")
+    if cache_file:
+        save_caches(cache_file, NORMALIZATION_CACHES)
+    
+    if profile:
+        for line in STAGES.table().splitlines():
+            logger.info(line)
+    if profile_json:
+        STAGES.write_json(profile_json)
+    if cprofile:
+        logger.info(f"cProfile stats saved to {cprofile} (view with python -m pstats)")
+    
+    # Failed documents are logged and skipped; the count lets callers report the run as failed
+    return len(failures)
@@ -0,0 +1,268 @@
+from .fields import FIELD_NAMES, NUMBER_LINE_RE
+import mmap
+import struct
+import zipfile
+import zlib
+from xml.etree.ElementTree import ParseError, XMLPullParser, fromstring
+
+# The main document part is whatever the package relationships point at (Word Online saves
+# word/document2.xml, for example); this name is only assumed when there is no relationship
+DOCUMENT_XML = 'word/document.xml'
+PACKAGE_RELS = '_rels/.rels'
+RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+OFFICE_DOCUMENT_TYPES = {
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument',
+    'http://purl.oclc.org/ooxml/officeDocument/relationships/officeDocument',
+}
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_BODY = W_NS + 'body'
+W_P = W_NS + 'p'
+W_TBL = W_NS + 'tbl'
+W_TR = W_NS + 'tr'
+W_TC = W_NS + 'tc'
+W_R = W_NS + 'r'
+W_HYPERLINK = W_NS + 'hyperlink'
+W_T = W_NS + 't'
+W_BR = W_NS + 'br'
+W_BR_TYPE = W_NS + 'type'
+
+LEDGER_LABELS = set(FIELD_NAMES)
+
+# Run children that stand for a fixed string, as python-docx's run.text maps them
+RUN_CHARACTERS = {
+    W_NS + 'tab': '\t',
+    W_NS + 'ptab': '\t',
+    W_NS + 'cr': '\n',
+    W_NS + 'noBreakHyphen': '-',
+}
+
+# Fixed part of a zip local file header; only the name and extra-field lengths are needed
+# to find where the member's data starts
+LOCAL_HEADER = struct.Struct('<4s22xHH')
+LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+# Compressed bytes handed to zlib at a time, and the most it may expand them to per step
+CHUNK_SIZE = 1 << 14
+MAX_OUTPUT = 1 << 14
+
+class StreamedParagraph:
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+class StreamingDocument:
+    # Stand-in for docx.Document: exposes .paragraphs so parse_records works unchanged,
+    # but reads the main document part incrementally instead of building the whole tree
+    def __init__(self, path, tables=True):
+        self.path = path
+        self.tables = tables
+
+    @property
+    def paragraphs(self):
+        for text in iter_paragraph_text(self.path, self.tables):
+            yield StreamedParagraph(text)
+
+class TextDocument:
+    # A run of already-extracted paragraph texts, e.g. one shard of a larger document
+    def __init__(self, texts):
+        self.texts = texts
+
+    @property
+    def paragraphs(self):
+        for text in self.texts:
+            yield StreamedParagraph(text)
+
+def run_text(r, parts):
+    for child in r:
+        tag = child.tag
+        if tag == W_T:
+            if child.text:
+                parts.append(child.text)
+        elif tag == W_BR:
+            # Page and column breaks have no text; only line breaks become "\n"
+            if child.get(W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            character = RUN_CHARACTERS.get(tag)
+            if character:
+                parts.append(character)
+
+def paragraph_text(p):
+    # Same text python-docx gives for Paragraph.text: only runs that are direct children of the
+    # paragraph or of a hyperlink in it count, so tab stops in w:pPr, text boxes, tracked
+    # changes and field instructions are left out just as they are there
+    parts = []
+    for child in p:
+        tag = child.tag
+        if tag == W_R:
+            run_text(child, parts)
+        elif tag == W_HYPERLINK:
+            for r in child:
+                if r.tag == W_R:
+                    run_text(r, parts)
+    return ''.join(parts)
+
+def main_part_name(archive):
+    # Target of the package's officeDocument relationship, read from _rels/.rels
+    try:
+        rels = fromstring(archive.read(PACKAGE_RELS))
+    except (KeyError, ParseError):
+        return DOCUMENT_XML
+    for relationship in rels.iter(RELATIONSHIP):
+        if relationship.get('Type') in OFFICE_DOCUMENT_TYPES and relationship.get('TargetMode') != 'External':
+            # Targets in the package rels are relative to the package root, or absolute
+            return relationship.get('Target', '').lstrip('/') or DOCUMENT_XML
+    return DOCUMENT_XML
+
+def iter_member_chunks(path, name=None):
+    # Yields the decompressed bytes of one zip member (the main document part when no name is
+    # given) read straight out of a memory-mapped file: the compressed data is never copied,
+    # and only one chunk of XML exists at a time. Stored members are yielded as views into
+    # the map, valid until the next chunk is asked for
+    with open(path, 'rb') as zip_file:
+        with zipfile.ZipFile(zip_file) as archive:
+            if name is None:
+                name = main_part_name(archive)
+            info = archive.getinfo(name)
+            if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                # Encrypted or unusually compressed members go through zipfile as before
+                with archive.open(info) as member:
+                    yield from iter(lambda: member.read(CHUNK_SIZE), b'')
+                return
+        if info.compress_size == 0:
+            return
+        with mmap.mmap(zip_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            signature, name_length, extra_length = LOCAL_HEADER.unpack_from(mapped, info.header_offset)
+            if signature != LOCAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile(f"Bad local file header for {name} in {path}")
+            start = info.header_offset + LOCAL_HEADER.size + name_length + extra_length
+            end = start + info.compress_size
+            if end > len(mapped):
+                raise zipfile.BadZipFile(f"Truncated data for {name} in {path}")
+            
+            view = memoryview(mapped)
+            chunk = None
+            try:
+                crc = 0
+                size = 0
+                if info.compress_type == zipfile.ZIP_STORED:
+                    for offset in range(start, end, CHUNK_SIZE):
+                        chunk = view[offset:min(offset + CHUNK_SIZE, end)]
+                        crc = zlib.crc32(chunk, crc)
+                        size += len(chunk)
+                        yield chunk
+                        chunk.release()
+                else:
+                    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                    for offset in range(start, end, CHUNK_SIZE):
+                        chunk = view[offset:min(offset + CHUNK_SIZE, end)]
+                        # max_length keeps a highly compressible chunk from expanding all at once
+                        data = decompressor.decompress(chunk, MAX_OUTPUT)
+                        while True:
+                            crc = zlib.crc32(data, crc)
+                            size += len(data)
+                            yield data
+                            if not decompressor.unconsumed_tail:
+                                break
+                            data = decompressor.decompress(decompressor.unconsumed_tail, MAX_OUTPUT)
+                        chunk.release()
+                    data = decompressor.flush()
+                    if data:
+                        crc = zlib.crc32(data, crc)
+                        size += len(data)
+                        yield data
+            finally:
+                # The map can only be closed once no views into it are left
+                if chunk is not None:
+                    chunk.release()
+                view.release()
+            if crc != info.CRC or size != info.file_size:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for {name} in {path}")
+
+def iter_xml_events(chunks):
+    parser = XMLPullParser(events=('start', 'end'))
+    for data in chunks:
+        parser.feed(data)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+def cell_texts(tc):
+    # Paragraphs of a table cell, including any nested table inside it
+    return [text for text in (paragraph_text(p).strip() for p in tc.iter(W_P)) if text]
+
+def row_texts(tr, ledger):
+    # Turns a label/value table row into the paragraphs the same ledger would have outside a
+    # table: "<label> <value>" followed by any further value paragraphs as continuation lines.
+    # Returns (texts, ledger). A table only counts as a ledger once a row's first cell is a
+    # field label or a row is a spanning "Number" line; until then its rows are skipped, so an
+    # incidental table (box lists etc.) in a paragraph ledger doesn't leak into the records
+    cells = [cell_texts(tc) for tc in tr.findall(W_TC)]
+    filled = [texts for texts in cells if texts]
+    if not filled:
+        return [], ledger
+    label = ' '.join(cells[0])
+    values = [text for texts in cells[1:] for text in texts]
+    if len(filled) > 1 or (values and not cells[0]):
+        if label in LEDGER_LABELS:
+            return [f"{label} {values[0]}"] + values[1:], True
+        if not ledger:
+            return [], ledger
+        if not label:
+            # Empty label cell: more of the previous field's value
+            return values, ledger
+        # Any other label ("Donor:", a typo) is kept as the paragraph it would have been and
+        # parsed as one, so its text isn't lost
+        return [f"{label} {values[0]}"] + values[1:], ledger
+    # A single non-empty cell: a heading, a spanning Number line, or a label with no value
+    texts = filled[0]
+    if NUMBER_LINE_RE.match(texts[0]) or (label in LEDGER_LABELS and not values):
+        return texts, True
+    return (texts if ledger else []), ledger
+
+def iter_paragraph_text(path, tables=True):
+    return iter_chunk_paragraph_text(iter_member_chunks(path), tables)
+
+def iter_chunk_paragraph_text(chunks, tables=True):
+    # Paragraph text from the bytes of the main document part, however they are delivered
+    body = None
+    table = None
+    ledger = False
+    depth = 0
+    body_depth = -1
+    for event, elem in iter_xml_events(chunks):
+        if event == 'start':
+            depth += 1
+            if elem.tag == W_BODY:
+                body = elem
+                body_depth = depth
+            elif depth == body_depth + 1 and elem.tag == W_TBL:
+                table = elem
+                ledger = False
+            continue
+
+        depth -= 1
+        # Rows of a top-level table are handled as they close so a ledger kept in one
+        # long table streams like one kept in paragraphs
+        if depth == body_depth + 1 and table is not None and elem.tag == W_TR:
+            texts = ()
+            if tables:
+                texts, ledger = row_texts(elem, ledger)
+            table.clear()
+            yield from texts
+            continue
+
+        # Otherwise only direct children of <w:body> count, like doc.paragraphs; anything
+        # nested is released together with its top-level parent
+        if depth != body_depth:
+            continue
+        if elem.tag == W_P:
+            text = paragraph_text(elem)
+            body.clear()
+            yield text
+        else:
+            table = None
+            body.clear()
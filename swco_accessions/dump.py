@@ -0,0 +1,65 @@
+from .docx_stream import iter_paragraph_text
+import argparse
+import json
+import re
+import sys
+
+# Everything outside printable ASCII: tabs, line breaks, smart quotes, accented letters, etc.
+UNUSUAL_RE = re.compile(r'[^\x20-\x7e]')
+
+def char_name(char):
+    return f"U+{ord(char):04X}"
+
+def dump_text(paragraphs, out):
+    # One block per paragraph with only the characters worth looking at, not every character
+    counts = {}
+    total = 0
+    for i, text in enumerate(paragraphs):
+        out.write(f"Paragraph {i+1}: length {len(text)}\nRaw content: {text!r}\n")
+        for match in UNUSUAL_RE.finditer(text):
+            char = match.group()
+            counts[char] = counts.get(char, 0) + 1
+            out.write(f"  Position {match.start()}: {char!r} ({char_name(char)})\n")
+        out.write("---\n")
+        total += 1
+    out.write(f"{total} paragraphs\n")
+    for char, count in sorted(counts.items(), key=lambda item: -item[1]):
+        out.write(f"  {char!r} ({char_name(char)}): {count}\n")
+    return total
+
+def dump_json(paragraphs, out):
+    # JSON Lines: one object per paragraph, then a summary object with per-character counts
+    counts = {}
+    total = 0
+    for i, text in enumerate(paragraphs):
+        unusual = []
+        for match in UNUSUAL_RE.finditer(text):
+            name = char_name(match.group())
+            counts[name] = counts.get(name, 0) + 1
+            unusual.append([match.start(), name])
+        out.write(json.dumps({'paragraph': i + 1, 'length': len(text), 'text': text, 'unusual': unusual},
+                             ensure_ascii=False) + '\n')
+        total += 1
+    out.write(json.dumps({'summary': {'paragraphs': total, 'unusual': counts}}) + '\n')
+    return total
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dump the raw paragraph text of an accession .docx for inspection")
+    parser.add_argument('input', nargs='?', default='./ignore/84-94A.docx')
+    parser.add_argument('-o', '--output', default='document_debug.txt', help="report file, or - for stdout")
+    parser.add_argument('--json', action='store_true', help="write JSON Lines instead of the text report")
+    parser.add_argument('--no-tables', dest='tables', action='store_false',
+                        help="read body paragraphs only, like the converter's --no-tables")
+    args = parser.parse_args(argv)
+
+    paragraphs = iter_paragraph_text(args.input, args.tables)
+    dump = dump_json if args.json else dump_text
+    if args.output == '-':
+        dump(paragraphs, sys.stdout)
+        return
+    with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        total = dump(paragraphs, out)
+    print(f"Dumped {total} paragraphs to {args.output}")
+
+if __name__ == "__main__":
+    main()
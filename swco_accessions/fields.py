@@ -0,0 +1,26 @@
+import re
+
+FIELD_NAMES = [
+    "Number", "DonationTypeID", "Donor", "Courtesy of", "Street", "City, State, Zip",
+    "Donation/Lending Date", "Main Entry", "Quantity", "Restrictions",
+    "Priority", "Assigned to Record Group", "Assigned for Processing?",
+    "Date assigned", "Processing Completed?", "Date completed", "Processor", "Lender",
+    "Provenance", "Temporary Location", "Special Notes", "Returned by", "Returned", "Date returned",
+    "Assigned to", "Scope and Content Note", "Materials Received By", "Permanent Location",
+    "Biographical/Historical"
+]
+
+PROPER_CASE_FIELDS = {
+    "Donor", "Courtesy of", "Street", "City", "Processor", "Lender",
+    "Returned by", "Assigned to", "Materials Received By"
+}
+
+# A "Number" label only counts when it is followed by a real accession number
+NUMBER_LINE_RE = re.compile(r'Number\s+\d{2}-\d+-[a-zA-Z]')
+
+DONATION_TYPE_MAP = {'A': '1', 'B': '2', 'C': '3', 'X': '4'}
+
+OUTPUT_FIELDS = FIELD_NAMES + ["City", "State", "Zip", "Address_Other"]
+
+# Records are lists in OUTPUT_FIELDS order; a field's slot is None until the ledger sets it
+FIELD_INDEX = {field: i for i, field in enumerate(OUTPUT_FIELDS)}
@@ -0,0 +1,39 @@
+import logging
+import sys
+
+logger = logging.getLogger('accessions')
+
+class BufferedFileHandler(logging.FileHandler):
+    # FileHandler flushes after every record, which is one write() per line;
+    # let the file buffer fill instead and flush on close or on warnings and above
+    def __init__(self, filename, buffer_size=1 << 16):
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode='w', encoding='utf-8')
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=self.buffer_size)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+def setup_logging(path='debug_output.txt', level=logging.INFO, console=True):
+    # Replaces the old per-message open/append/print debug_print helper. Per-paragraph and
+    # per-field tracing is logged at DEBUG, so the default INFO level skips it
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(level)
+    logger.propagate = False
+
+    if path:
+        logger.addHandler(BufferedFileHandler(path))
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        logger.addHandler(console_handler)
+    return logger
@@ -0,0 +1,119 @@
+import re
+
+STATE_MAP = {
+    'al': 'AL', 'ak': 'AK', 'az': 'AZ', 'ar': 'AR', 'ca': 'CA', 'co': 'CO', 'ct': 'CT', 'de': 'DE', 'fl': 'FL',
+    'ga': 'GA', 'hi': 'HI', 'id': 'ID', 'il': 'IL', 'in': 'IN', 'ia': 'IA', 'ks': 'KS', 'ky': 'KY', 'la': 'LA',
+    'me': 'ME', 'md': 'MD', 'ma': 'MA', 'mi': 'MI', 'mn': 'MN', 'ms': 'MS', 'mo': 'MO', 'mt': 'MT', 'ne': 'NE',
+    'nv': 'NV', 'nh': 'NH', 'nj': 'NJ', 'nm': 'NM', 'ny': 'NY', 'nc': 'NC', 'nd': 'ND', 'oh': 'OH', 'ok': 'OK',
+    'or': 'OR', 'pa': 'PA', 'ri': 'RI', 'sc': 'SC', 'sd': 'SD', 'tn': 'TN', 'tx': 'TX', 'ut': 'UT', 'vt': 'VT',
+    'va': 'VA', 'wa': 'WA', 'wv': 'WV', 'wi': 'WI', 'wy': 'WY',
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR', 'california': 'CA', 'colorado': 'CO',
+    'connecticut': 'CT', 'delaware': 'DE', 'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS', 'kentucky': 'KY', 'louisiana': 'LA',
+    'maine': 'ME', 'maryland': 'MD', 'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN',
+    'mississippi': 'MS', 'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY', 'north carolina': 'NC',
+    'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK', 'oregon': 'OR', 'pennsylvania': 'PA',
+    'rhode island': 'RI', 'south carolina': 'SC', 'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX',
+    'utah': 'UT', 'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY'
+}
+
+def proper_case(text):
+    lowercase_words = {'of', 'the', 'in', 'on', 'at', 'to', 'for', 'and', 'by'}
+    words = text.split()
+    capitalized_words = [word.capitalize() if word.lower() not in lowercase_words else word.lower() for word in words]
+    return ' '.join(capitalized_words)
+
+ZIP_TYPO_TABLE = str.maketrans('lI', '11')
+
+def clean_zip_code(zip_code):
+    # Replace 'l' or 'I' with '1' if they appear in the zip code, and remove any spaces
+    zip_code = zip_code.translate(ZIP_TYPO_TABLE).replace(' ', '')
+    
+    # Check if it's a 9-digit zip code (possibly with hyphen)
+    if len(zip_code) >= 9:
+        return f"{zip_code[:5]}-{zip_code[5:9]}"
+    
+    # If it's a 5-digit zip code, return as is
+    elif len(zip_code) == 5:
+        return zip_code
+    
+    # If it doesn't match expected formats, return original
+    return zip_code
+
+# State names in the order the comma-insertion step prefers them: longest first,
+# ties in STATE_MAP order
+STATE_PRIORITY = {name: rank for rank, name in enumerate(sorted(STATE_MAP, key=len, reverse=True))}
+# Finds every whitespace-delimited state name in one scan; the alternation is in priority
+# order, so at each position the preferred name is the one reported. Each name has its own
+# group and is identified by lastindex, not by the matched text: IGNORECASE also matches
+# Unicode case variants ('ı', 'İ', 'ſ') whose lower() is not a STATE_MAP key
+STATE_SCAN_NAMES = list(STATE_PRIORITY)
+STATE_SCAN_RE = re.compile(r'(?<=\s)(?:' + '|'.join('(' + re.escape(name) + ')' for name in STATE_SCAN_NAMES) + r')(?=\s)',
+                           re.IGNORECASE)
+STATE_COMMA_RES = {name: re.compile(r'(\s)(' + re.escape(name) + r')\s', re.IGNORECASE) for name in STATE_MAP}
+STATE_WORD_RE = re.compile(r'\b(' + '|'.join(STATE_MAP.keys()) + r')\b')
+COMMA_SPACE_RE = re.compile(r',(\S)')
+ZIP_RE = re.compile(r'\b\d{5}(\s*-\s*\d{4})?\b')
+ZIP_TYPO_RE = re.compile(r'\b[0-9lI]{5}([- ][0-9lI]{4})?\b', re.IGNORECASE)
+# Zip handling of convert_accession_document10/11, before clean_zip_code: a comma goes in front
+# of any bare zip, and only an unspaced ZIP+4 is recognised
+RAW_ZIP_COMMA_RE = re.compile(r'(\s)(\d{5}(-\d{4})?)\b')
+RAW_ZIP_RE = re.compile(r'\b\d{5}(-\d{4})?\b')
+
+def parse_city_state_zip(address, clean_zips=True):
+    city = state = zip_code = address_other = ''
+    
+    # Ensure there's a space after each comma
+    address = COMMA_SPACE_RE.sub(r', \1', address)
+    
+    # Add comma before state if not present
+    best_name = None
+    for state_match in STATE_SCAN_RE.finditer(address):
+        name = STATE_SCAN_NAMES[state_match.lastindex - 1]
+        if best_name is None or STATE_PRIORITY[name] < STATE_PRIORITY[best_name]:
+            best_name = name
+    if best_name is not None:
+        address = STATE_COMMA_RES[best_name].sub(r',\1\2 ', address)
+    
+    if not clean_zips:
+        # Add comma before zip code if not present
+        address = RAW_ZIP_COMMA_RE.sub(r',\1\2', address)
+    
+    # Split the address into parts
+    parts = [p.strip() for p in address.split(',')]
+    
+    if len(parts) >= 2:
+        city = parts[0]
+        remaining = ' '.join(parts[1:]).strip()
+        
+        # Try to find state
+        state_match = STATE_WORD_RE.search(remaining.lower())
+        if state_match:
+            state = STATE_MAP[state_match.group(1).lower()]
+            remaining = remaining[:state_match.start()].strip() + ' ' + remaining[state_match.end():].strip()
+        
+        # Try to find zip code (including two-part zip codes with potential spaces)
+        zip_match = (ZIP_RE if clean_zips else RAW_ZIP_RE).search(remaining)
+        if zip_match:
+            zip_code = clean_zip_code(zip_match.group()) if clean_zips else zip_match.group()
+            remaining = remaining[:zip_match.start()].strip() + ' ' + remaining[zip_match.end():].strip()
+        elif clean_zips:
+            # Try to find potential typo zip codes
+            typo_match = ZIP_TYPO_RE.search(remaining)
+            if typo_match:
+                zip_code = clean_zip_code(typo_match.group())
+                remaining = remaining[:typo_match.start()].strip() + ' ' + remaining[typo_match.end():].strip()
+        
+        address_other = remaining.strip()
+    else:
+        # If there's only one part, treat it as city
+        city = address
+    
+    return city, state, zip_code, address_other
+
+def parse_city_state_zip_raw_zips(address):
+    # Address splitting as convert_accession_document10/11 did it, before clean_zip_code:
+    # no l/I fixes or typo zips, and their comma-before-zip and ZIP+4 rules
+    return parse_city_state_zip(address, clean_zips=False)
@@ -0,0 +1,135 @@
+from .docx_stream import iter_chunk_paragraph_text, iter_member_chunks
+from .records import DEFAULT_OPTIONS, iter_record_chunks, parse_chunk
+import queue
+import threading
+
+# Converts a batch of documents as a chain of threads joined by bounded queues:
+#
+#   read      decompress the main document part into byte chunks
+#   classify  parse the XML into paragraphs and split them into record blocks at Number lines
+#   parse     turn each block into records, normalizing addresses and names
+#   write     the caller's loop, writing records to the sink
+#
+# Reading the next document from a network share overlaps with parsing and writing the
+# current one. zlib and file I/O release the GIL; the Python stages still take turns, so this
+# helps when reads or writes are slow, not with CPU-bound batches (use --workers for those).
+# A full queue blocks the stage feeding it, which bounds memory however slow the sink is.
+#
+# Documents pass through every stage in order. Each one's items end with END, or with a
+# StageFailure in place of END when a stage fails on it; later documents carry on as normal.
+
+END = object()
+
+class StageFailure:
+    def __init__(self, error):
+        self.error = error
+
+class PipelineClosed(Exception):
+    pass
+
+class DocumentItems:
+    # The items of one document taken off a stage's inbox; an upstream failure is re-raised
+    def __init__(self, pipeline, inbox):
+        self.pipeline = pipeline
+        self.inbox = inbox
+        self.finished = False
+
+    def __iter__(self):
+        while not self.finished:
+            item = self.pipeline.get(self.inbox)
+            if item is END:
+                self.finished = True
+            elif isinstance(item, StageFailure):
+                self.finished = True
+                raise item.error
+            else:
+                yield item
+
+    def drain(self):
+        # Skips the rest of a document this stage gave up on, so the next one starts in step
+        while not self.finished:
+            item = self.pipeline.get(self.inbox)
+            self.finished = item is END or isinstance(item, StageFailure)
+
+class Pipeline:
+    def __init__(self, paths, options=DEFAULT_OPTIONS, block_records=100, queue_size=8, chunk_queue_size=64):
+        self.paths = paths
+        self.closed = threading.Event()
+        chunks = queue.Queue(chunk_queue_size)
+        blocks = queue.Queue(queue_size)
+        self.parsed = queue.Queue(queue_size)
+        tables = options.tables
+
+        def read(path, items):
+            for chunk in iter_member_chunks(path):
+                # Stored members come out as views into the map, only valid until the next chunk
+                yield chunk if isinstance(chunk, bytes) else bytes(chunk)
+
+        def classify(path, items):
+            return iter_record_chunks(iter_chunk_paragraph_text(items, tables), block_records)
+
+        def parse(path, items):
+            for block in items:
+                yield parse_chunk(block, options)
+
+        self.threads = [
+            threading.Thread(target=self.stage, args=(read, None, chunks), name='pipeline-read', daemon=True),
+            threading.Thread(target=self.stage, args=(classify, chunks, blocks), name='pipeline-classify', daemon=True),
+            threading.Thread(target=self.stage, args=(parse, blocks, self.parsed), name='pipeline-parse', daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def get(self, inbox):
+        while True:
+            try:
+                return inbox.get(timeout=0.1)
+            except queue.Empty:
+                if self.closed.is_set():
+                    raise PipelineClosed()
+
+    def put(self, outbox, item):
+        while True:
+            try:
+                outbox.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                if self.closed.is_set():
+                    raise PipelineClosed()
+
+    def stage(self, work, inbox, outbox):
+        try:
+            for path in self.paths:
+                items = DocumentItems(self, inbox) if inbox is not None else None
+                try:
+                    for item in work(path, items):
+                        self.put(outbox, item)
+                    result = END
+                except PipelineClosed:
+                    raise
+                except Exception as e:
+                    result = StageFailure(e)
+                if items is not None:
+                    items.drain()
+                self.put(outbox, result)
+        except PipelineClosed:
+            pass
+
+    def __iter__(self):
+        # Yields (path, blocks) in input order; iterating blocks gives lists of records and raises
+        # if any stage failed on that document. Blocks left unread are skipped
+        for path in self.paths:
+            blocks = DocumentItems(self, self.parsed)
+            yield path, blocks
+            blocks.drain()
+
+    def close(self):
+        self.closed.set()
+        for thread in self.threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
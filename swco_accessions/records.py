@@ -0,0 +1,202 @@
+from .cache import NormalizationCache
+from .docx_stream import TextDocument
+from .fields import DONATION_TYPE_MAP, FIELD_INDEX, FIELD_NAMES, NUMBER_LINE_RE, OUTPUT_FIELDS, PROPER_CASE_FIELDS
+from .log import logger
+from .normalize import parse_city_state_zip, parse_city_state_zip_raw_zips, proper_case
+from .stage_timer import StageTimer
+import logging
+import re
+
+# One alternation over all labels, tried in FIELD_NAMES order, so the first label that
+# prefixes the paragraph wins just like the old startswith loop ("Returned by" before "Returned")
+FIELD_RE = re.compile('|'.join(re.escape(field) for field in FIELD_NAMES))
+NUMBER_VALUE_RE = re.compile(r'(\d{2}-\d+)-([a-zA-Z])')
+PAGE_MARKER_RE = re.compile(r'\[\[\d+\]\]')
+
+NUMBER = FIELD_INDEX["Number"]
+DONATION_TYPE_ID = FIELD_INDEX["DonationTypeID"]
+CITY = FIELD_INDEX["City"]
+STATE = FIELD_INDEX["State"]
+ZIP = FIELD_INDEX["Zip"]
+ADDRESS_OTHER = FIELD_INDEX["Address_Other"]
+RECORD_SIZE = len(OUTPUT_FIELDS)
+
+class ParseOptions:
+    # The behaviours that used to differ between the convert_accession_document*.py variants
+    def __init__(self, split_address=True, proper_case=True, clean_zips=True, tables=True):
+        # Split "City, State, Zip" into the City/State/Zip/Address_Other columns
+        self.split_address = split_address
+        # Proper-case the name and street fields in PROPER_CASE_FIELDS
+        self.proper_case = proper_case
+        # Fix l/I typos in zip codes and normalise ZIP+4 formatting
+        self.clean_zips = clean_zips
+        # Read label/value rows of Word tables as well as body paragraphs
+        self.tables = tables
+
+    def as_dict(self):
+        return {'split_address': self.split_address, 'proper_case': self.proper_case, 'clean_zips': self.clean_zips,
+                'tables': self.tables}
+
+DEFAULT_OPTIONS = ParseOptions()
+
+STAGES = StageTimer()
+
+# The same City/State/Zip strings and names recur across thousands of records
+cached_parse_city_state_zip = NormalizationCache(parse_city_state_zip)
+cached_parse_city_state_zip_raw_zips = NormalizationCache(parse_city_state_zip_raw_zips)
+cached_proper_case = NormalizationCache(proper_case)
+NORMALIZATION_CACHES = (cached_parse_city_state_zip, cached_parse_city_state_zip_raw_zips, cached_proper_case)
+
+# The untimed entry points, kept so timing can be switched on and off without nesting wrappers
+UNTIMED = {}
+
+def enable_stage_timing():
+    # Swaps the per-paragraph entry points for timed wrappers; the disabled path is untouched
+    global match_field, cached_parse_city_state_zip, cached_parse_city_state_zip_raw_zips, cached_proper_case
+    if STAGES.enabled:
+        return
+    if not UNTIMED:
+        UNTIMED.update(match_field=match_field, cached_parse_city_state_zip=cached_parse_city_state_zip,
+                       cached_parse_city_state_zip_raw_zips=cached_parse_city_state_zip_raw_zips,
+                       cached_proper_case=cached_proper_case)
+    STAGES.enable()
+    match_field = STAGES.wrap('classify', UNTIMED['match_field'])
+    cached_parse_city_state_zip = STAGES.wrap('parse_city_state_zip', UNTIMED['cached_parse_city_state_zip'])
+    cached_parse_city_state_zip_raw_zips = STAGES.wrap('parse_city_state_zip',
+                                                       UNTIMED['cached_parse_city_state_zip_raw_zips'])
+    cached_proper_case = STAGES.wrap('proper_case', UNTIMED['cached_proper_case'])
+
+def disable_stage_timing():
+    global match_field, cached_parse_city_state_zip, cached_parse_city_state_zip_raw_zips, cached_proper_case
+    if not STAGES.enabled:
+        return
+    STAGES.disable()
+    match_field = UNTIMED['match_field']
+    cached_parse_city_state_zip = UNTIMED['cached_parse_city_state_zip']
+    cached_parse_city_state_zip_raw_zips = UNTIMED['cached_parse_city_state_zip_raw_zips']
+    cached_proper_case = UNTIMED['cached_proper_case']
+
+def match_field(text):
+    field_match = FIELD_RE.match(text)
+    if not field_match:
+        return None
+    field = field_match.group()
+    # A "Number" label only counts when it is a real accession number line
+    if field == "Number" and not NUMBER_LINE_RE.match(text):
+        return None
+    return field
+
+def join_continued(record, continued):
+    for index, fragments in continued.items():
+        record[index] = " ".join(fragments)
+    continued.clear()
+
+def iter_records(doc, options=DEFAULT_OPTIONS):
+    # Yields each record as a list in OUTPUT_FIELDS order (see fields.FIELD_INDEX)
+    current_record = None
+    current_index = None
+    # Continuation lines are collected per field and joined once when the record closes;
+    # appending to the string on every line made long notes quadratic
+    continued = {}
+    trace = logger.isEnabledFor(logging.DEBUG)
+    split_address = options.split_address
+    parse_address = cached_parse_city_state_zip if options.clean_zips else cached_parse_city_state_zip_raw_zips
+    case_fields = PROPER_CASE_FIELDS if options.proper_case else ()
+    
+    for i, paragraph in enumerate(doc.paragraphs):
+        text = paragraph.text.strip()
+        
+        if trace:
+            logger.debug(f"Processing paragraph {i+1}: {text}")
+        
+        if not text or text == "Accession Records":
+            continue
+        
+        if PAGE_MARKER_RE.match(text):
+            continue
+        
+        field = match_field(text)
+        if field:
+            value = text[len(field):].strip()
+            
+            if field == "Number":
+                if current_record is not None:
+                    if continued:
+                        join_continued(current_record, continued)
+                    yield current_record
+                current_record = [None] * RECORD_SIZE
+                number_match = NUMBER_VALUE_RE.search(value)
+                if number_match:
+                    current_record[NUMBER] = '19' + number_match.group(1)
+                    current_record[DONATION_TYPE_ID] = DONATION_TYPE_MAP.get(number_match.group(2), '0')
+                else:
+                    logger.warning(f"Unexpected Number format: {value}")
+                    current_record[NUMBER] = '19' + value
+                    current_record[DONATION_TYPE_ID] = '0'
+                if trace:
+                    logger.debug(f"Found field: Number = {current_record[NUMBER]}")
+                    logger.debug(f"Found field: DonationTypeID = {current_record[DONATION_TYPE_ID]}")
+            elif field == "City, State, Zip" and split_address:
+                current_record[FIELD_INDEX[field]] = value  # Keep original value
+                city, state, zip_code, address_other = parse_address(value)
+                current_record[CITY] = cached_proper_case(city) if case_fields else city
+                current_record[STATE] = state
+                current_record[ZIP] = zip_code
+                current_record[ADDRESS_OTHER] = address_other
+                if trace:
+                    logger.debug(f"Found field: City = {current_record[CITY]}")
+                    logger.debug(f"Found field: State = {state}")
+                    logger.debug(f"Found field: Zip = {zip_code}")
+                    logger.debug(f"Found field: Address_Other = {address_other}")
+            elif field in case_fields:
+                current_record[FIELD_INDEX[field]] = cached_proper_case(value)
+            else:
+                current_record[FIELD_INDEX[field]] = value
+            if trace:
+                logger.debug(f"Found field: {field} = {value}")
+            
+            current_index = FIELD_INDEX[field]
+            if continued:
+                # A repeated label replaces the value, continuation lines included
+                continued.pop(current_index, None)
+        elif current_record is not None and current_index is not None:
+            fragments = continued.get(current_index)
+            if fragments is None:
+                previous = current_record[current_index]
+                fragments = continued[current_index] = [] if previous is None else [previous]
+            fragments.append(text)
+            if trace:
+                logger.debug(f"Appended to {OUTPUT_FIELDS[current_index]}: {text}")
+    
+    if current_record is not None:
+        if continued:
+            join_continued(current_record, continued)
+        yield current_record
+
+def parse_records(doc, options=DEFAULT_OPTIONS):
+    records = list(iter_records(doc, options))
+    logger.info(f"Total records found: {len(records)}")
+    return records
+
+def iter_record_chunks(texts, chunk_records):
+    # Splits a paragraph stream into chunks that each start at a Number line (except the
+    # leading chunk). A Number line resets all parser state, so every chunk parses on its own
+    # exactly as it would in the middle of the serial run
+    # The untimed matcher: every paragraph is classified again when its chunk is parsed, and
+    # timing this pass as well would count the "classify" stage twice
+    is_field = UNTIMED.get('match_field', match_field)
+    chunk = []
+    records = 0
+    for text in texts:
+        if is_field(text.strip()) == "Number":
+            if records == chunk_records:
+                yield chunk
+                chunk = []
+                records = 0
+            records += 1
+        chunk.append(text)
+    if chunk:
+        yield chunk
+
+def parse_chunk(texts, options=DEFAULT_OPTIONS):
+    return list(iter_records(TextDocument(texts), options))
@@ -0,0 +1,192 @@
+from .fields import OUTPUT_FIELDS
+import csv
+import json
+
+def record_row(record):
+    # Records leave unset fields as None; rows are written with empty strings
+    return ["" if value is None else value for value in record]
+
+class CsvSink:
+    # Rows are written as each record closes; the file is only created once there is one
+    def __init__(self, path):
+        self.path = path
+        self.csvfile = None
+        self.writer = None
+        self.count = 0
+
+    def write(self, record):
+        # csv writes None as an empty field, so records go out without conversion
+        self.write_row(record)
+
+    def write_row(self, row):
+        if self.csvfile is None:
+            self.csvfile = open(self.path, 'w', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.csvfile, quoting=csv.QUOTE_ALL)
+            self.writer.writerow(OUTPUT_FIELDS)
+        self.writer.writerow(row)
+        self.count += 1
+
+    def close(self):
+        if self.csvfile is not None:
+            self.csvfile.close()
+            self.csvfile = None
+
+# Parquet column types; everything not listed is free text in the ledgers and stays a string
+PARQUET_INT_FIELDS = {"DonationTypeID"}
+
+class ParquetSink:
+    # Columnar output via pyarrow, written one record batch at a time as rows arrive
+    def __init__(self, path, batch_size=10000):
+        # pyarrow is only needed for this sink, so it is imported here rather than at the top
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.batch_size = batch_size
+        self.columns = [[] for _ in OUTPUT_FIELDS]
+        self.writer = None
+        self.count = 0
+        self.pending = 0
+
+    def write(self, record):
+        self.write_row(record_row(record))
+
+    def write_row(self, row):
+        for column, value in zip(self.columns, row):
+            column.append(value)
+        self.count += 1
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        pa = self.pa
+        if self.writer is None:
+            self.schema = pa.schema([
+                pa.field(field, pa.int8() if field in PARQUET_INT_FIELDS else pa.string())
+                for field in OUTPUT_FIELDS
+            ])
+            self.writer = self.pq.ParquetWriter(self.path, self.schema, compression='zstd')
+        arrays = []
+        for field, column in zip(OUTPUT_FIELDS, self.columns):
+            if field in PARQUET_INT_FIELDS:
+                column = [int(value) if value.isdigit() else None for value in column]
+            arrays.append(column)
+        self.writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self.columns = [[] for _ in OUTPUT_FIELDS]
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+SQLITE_INDEXED_FIELDS = ["DonationTypeID", "Donor", "State"]
+
+def sqlite_column(field):
+    return '"' + field.replace('"', '""') + '"'
+
+class SqliteSink:
+    # Writes straight into a local SQLite table, keyed by accession Number so re-runs upsert
+    def __init__(self, path, batch_size=1000, table='accessions'):
+        import sqlite3
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self.batch = []
+        self.connection = sqlite3.connect(path)
+        columns = [
+            f"{sqlite_column(field)} {'INTEGER' if field in PARQUET_INT_FIELDS else 'TEXT'}"
+            + (" PRIMARY KEY" if field == "Number" else "")
+            for field in OUTPUT_FIELDS
+        ]
+        with self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+            for field in SQLITE_INDEXED_FIELDS:
+                index = f"idx_{table}_{field.lower()}"
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({sqlite_column(field)})")
+        placeholders = ', '.join('?' for _ in OUTPUT_FIELDS)
+        self.insert_sql = f"INSERT OR REPLACE INTO {table} ({', '.join(map(sqlite_column, OUTPUT_FIELDS))}) VALUES ({placeholders})"
+
+    def write(self, record):
+        self.write_row(record_row(record))
+
+    def write_row(self, row):
+        self.batch.append(row)
+        self.count += 1
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        # One transaction per batch
+        with self.connection:
+            self.connection.executemany(self.insert_sql, self.batch)
+        self.batch = []
+
+    def close(self):
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+class JsonlSink:
+    # One JSON object per record. Plain output is line-buffered so partial runs can be tailed;
+    # .gz/.zst output is flushed every flush_every records so it stays readable mid-run
+    def __init__(self, path, flush_every=100, compress=None):
+        self.path = path
+        self.flush_every = flush_every
+        self.stream = None
+        self.count = 0
+        # An explicit compression wins over the path; otherwise a .gz/.zst suffix picks it
+        if compress is None:
+            compress = next((name for name, suffix in COMPRESSION_SUFFIXES.items() if path.endswith(suffix)), None)
+        elif compress not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression {compress!r}, expected one of {', '.join(COMPRESSION_SUFFIXES)}")
+        self.compress = compress
+
+    def open(self):
+        import io
+        if self.compress == 'gzip':
+            import gzip
+            return io.TextIOWrapper(gzip.open(self.path, 'wb'), encoding='utf-8')
+        if self.compress == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise RuntimeError("zstd output needs zstandard (pip install zstandard)")
+            raw = open(self.path, 'wb')
+            return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(raw), encoding='utf-8')
+        return open(self.path, 'w', encoding='utf-8', buffering=1)
+
+    def write(self, record):
+        # Only the fields the ledger set, as before
+        self.write_object({field: value for field, value in zip(OUTPUT_FIELDS, record) if value is not None})
+
+    def write_row(self, row):
+        self.write_object(dict(zip(OUTPUT_FIELDS, row)))
+
+    def write_object(self, combined_record):
+        if self.stream is None:
+            self.stream = self.open()
+        self.stream.write(json.dumps(combined_record, ensure_ascii=False) + '\n')
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.stream.flush()
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+SINKS = {'csv': CsvSink, 'parquet': ParquetSink, 'sqlite': SqliteSink, 'jsonl': JsonlSink}
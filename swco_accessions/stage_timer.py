@@ -0,0 +1,103 @@
+import json
+import threading
+import time
+
+class StageTimer:
+    # Accumulates wall time and call counts per pipeline stage. Nothing is wrapped until
+    # enable() is called, so a normal run pays only for the `enabled` checks made once per document
+    def __init__(self):
+        self.enabled = False
+        self.seconds = {}
+        self.calls = {}
+        self.started = None
+        self.elapsed = 0.0
+        # --pipeline runs the stages in threads that all add to the same totals
+        self.lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        # Forget earlier runs in the same process
+        self.seconds = {}
+        self.calls = {}
+        self.started = None
+        self.elapsed = 0.0
+
+    def add(self, stage, seconds, calls=1):
+        with self.lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    def wrap(self, stage, func):
+        perf_counter = time.perf_counter
+        add = self.add
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add(stage, perf_counter() - start)
+        return timed
+
+    def iterate(self, stage, iterable):
+        # Times only the work of producing each item, not the consumer's loop body
+        perf_counter = time.perf_counter
+        iterator = iter(iterable)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(stage, perf_counter() - start, 0)
+                return
+            self.add(stage, perf_counter() - start)
+            yield item
+
+    def document(self, doc, stage='load'):
+        return TimedDocument(doc, self, stage)
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def stop(self):
+        if self.started is not None:
+            self.elapsed += time.perf_counter() - self.started
+            self.started = None
+
+    def summary(self):
+        rows = [
+            {'stage': stage, 'seconds': seconds, 'calls': self.calls[stage]}
+            for stage, seconds in sorted(self.seconds.items(), key=lambda item: -item[1])
+        ]
+        other = self.elapsed - sum(self.seconds.values())
+        if self.elapsed:
+            rows.append({'stage': 'other', 'seconds': max(other, 0.0), 'calls': 0})
+        return {'total_seconds': self.elapsed, 'stages': rows}
+
+    def table(self):
+        summary = self.summary()
+        total = summary['total_seconds'] or 1.0
+        lines = [f"{'stage':<22} {'seconds':>9} {'share':>6} {'calls':>10}"]
+        for row in summary['stages']:
+            lines.append(f"{row['stage']:<22} {row['seconds']:>9.3f} {row['seconds'] / total:>6.1%} {row['calls']:>10}")
+        lines.append(f"{'total':<22} {summary['total_seconds']:>9.3f}")
+        return '\n'.join(lines)
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as json_file:
+            json.dump(self.summary(), json_file, indent=2)
+
+class TimedDocument:
+    def __init__(self, doc, timer, stage):
+        self.doc = doc
+        self.timer = timer
+        self.stage = stage
+
+    @property
+    def paragraphs(self):
+        return self.timer.iterate(self.stage, self.doc.paragraphs)